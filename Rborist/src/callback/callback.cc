@@ -26,6 +26,8 @@
 #include "rowSample.h"
 #include "callback.h"
 
+#include <algorithm>
+
 using namespace std;
 vector<unsigned int> CallBack::sampleRows(unsigned int nSamp) {
   IntegerVector rowSample(RowSample::sampleRows(nSamp));
@@ -38,8 +40,9 @@ vector<unsigned int> CallBack::sampleRows(unsigned int nSamp) {
 vector<double> CallBack::rUnif(size_t len, double scale) {
   RNGScope scope;
   NumericVector rn(runif(len));
-  rn = rn * scale;
 
-  vector<double> rnOut(rn.begin(), rn.end());
+  // Scales while copying out, avoiding a temporary R vector.
+  vector<double> rnOut(rn.length());
+  std::transform(rn.begin(), rn.end(), rnOut.begin(), [scale](double u) { return u * scale; });
   return rnOut;
 }
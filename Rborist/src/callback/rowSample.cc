@@ -35,9 +35,9 @@ IntegerVector rowSeqNull(0);
 IntegerVector &RowSample::rowSeq = rowSeqNull;
 
 
-void RowSample::init(const NumericVector &feWeight, bool withRepl_) {
-  weight = feWeight;
-  rowSeq = seq(0, feWeight.length()-1);
+void RowSample::init(const SEXP sWeight, size_t nRow, bool withRepl_) {
+  weight = Rf_isNull(sWeight) ? NumericVector(0) : NumericVector(sWeight);
+  rowSeq = seq(0, nRow - 1);
 
   withRepl = withRepl_;
 }
@@ -46,7 +46,9 @@ void RowSample::init(const NumericVector &feWeight, bool withRepl_) {
 IntegerVector RowSample::sampleRows(unsigned int nSamp) {
   BEGIN_RCPP
   RNGScope scope;
-  return sample(rowSeq, nSamp, withRepl, clone(weight));
+  // Uniform sampling needs no probability vector.  Weighted sampling
+  // normalizes a private copy, so the weight vector is shared across trees.
+  return weight.length() == 0 ? sample(rowSeq, nSamp, withRepl) : sample(rowSeq, nSamp, withRepl, weight);
 
   END_RCPP
 }
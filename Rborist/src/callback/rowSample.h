@@ -39,18 +39,22 @@ using namespace Rcpp;
  */
 class RowSample {
   static bool withRepl; // Whether sampling employs replacement.
-  static NumericVector &weight; // Pinned vector[nRow] of weights.
+  static NumericVector &weight; // Pinned vector[nRow] of weights, else empty.
   static IntegerVector &rowSeq; // Pinned sequence from 0 to nRow - 1.
 public:
 
   /**
    @brief Caches row sampling parameters as static values.
 
-   @param feWeight is user-specified weighting of row samples.
+   @param sWeight is user-specified weighting of row samples, if any.
+   Null denotes uniform weighting.
+
+   @param nRow is the number of rows from which to sample.
 
    @param withRepl_ is true iff sampling with replacement.
  */
-  static void init(const NumericVector &feWeight,
+  static void init(const SEXP sWeight,
+                   size_t nRow,
                    bool withRepl_);
 
   /**
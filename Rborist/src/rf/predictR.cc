@@ -300,7 +300,7 @@ NumericMatrix PBRf::getQPred(const PredictRegBridge* pBridge) {
 
   size_t nRow(pBridge->getNRow());
   auto qPred = pBridge->getQPred();
-  return qPred.empty() ? NumericMatrix(0) : transpose(NumericMatrix(qPred.size() / nRow, nRow, qPred.begin()));
+  return qPred.empty() ? NumericMatrix(0) : transposeCore<NumericMatrix>(&qPred[0], nRow, qPred.size() / nRow);
     
   END_RCPP
 }
@@ -525,7 +525,7 @@ IntegerMatrix LeafCtgRf::getCensus(const PredictCtgBridge* pBridge,
                                    const CharacterVector& levelsTrain,
                                    const CharacterVector& ctgNames) {
   BEGIN_RCPP
-  IntegerMatrix census = transpose(IntegerMatrix(levelsTrain.length(), pBridge->getNRow(), pBridge->getCensus()));
+  IntegerMatrix census = PBRf::transposeCore<IntegerMatrix>(pBridge->getCensus(), pBridge->getNRow(), levelsTrain.length());
   census.attr("dimnames") = List::create(ctgNames, levelsTrain);
   return census;
   END_RCPP
@@ -537,7 +537,7 @@ NumericMatrix LeafCtgRf::getProb(const PredictCtgBridge* pBridge,
                                  const CharacterVector& ctgNames) {
   BEGIN_RCPP
   if (!pBridge->getProb().empty()) {
-    NumericMatrix prob = transpose(NumericMatrix(levelsTrain.length(), pBridge->getNRow(), &(pBridge->getProb())[0]));
+    NumericMatrix prob = PBRf::transposeCore<NumericMatrix>(&(pBridge->getProb())[0], pBridge->getNRow(), levelsTrain.length());
     prob.attr("dimnames") = List::create(ctgNames, levelsTrain);
     return prob;
   }
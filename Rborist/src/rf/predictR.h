@@ -28,6 +28,10 @@
 #define RF_PREDICT_R_H
 
 #include <Rcpp.h>
+#include <algorithm>
+
+#include "ompthread.h"
+#include "rleframe.h"
 using namespace Rcpp;
 
 
@@ -117,6 +121,46 @@ RcppExport SEXP TestVotes(const SEXP sFrame,
    @brief Bridge-variant PredictBridge pins unwrapped front-end structures.
  */
 struct PBRf {
+  /**
+     @brief Relays out a row-major core matrix into a column-major
+     front-end matrix in a single pass.
+
+     Rows are visited in tiles, so that the strided reads of a tile
+     remain cached across columns.  Tiles share the extent used by the
+     transposition of the observation frame.  Tiles write disjoint ranges of
+     each output column, and so are distributed among threads.
+
+     @param coreVal is the core matrix, in row-major order.
+
+     @param nRow is the number of rows.
+
+     @param nCol is the number of columns.
+
+     @return column-major matrix with dimensions (nRow, nCol).
+   */
+  template<typename matType, typename valType>
+  static matType transposeCore(const valType coreVal[],
+                               size_t nRow,
+                               size_t nCol) {
+    matType matOut(nRow, nCol);
+    auto outBase = matOut.begin(); // Raw access within parallel region.
+    OMPBound rowTop = nRow;
+#pragma omp parallel default(shared) num_threads(OmpThread::nThread)
+    {
+#pragma omp for schedule(dynamic, 1)
+      for (OMPBound rowStart = 0; rowStart < rowTop; rowStart += RLEFrame::tileRows) {
+	size_t rowEnd = std::min(nRow, rowStart + RLEFrame::tileRows);
+	for (size_t col = 0; col < nCol; col++) {
+	  for (size_t row = rowStart; row < rowEnd; row++) {
+	    outBase[col * nRow + row] = coreVal[row * nCol + col];
+	  }
+	}
+      }
+    }
+    return matOut;
+  }
+
+
 
   static List predictCtg(const List& lDeframe,
 			 const List& lTrain,
@@ -31,6 +31,9 @@
 #include "rleframeR.h"
 #include "rleframe.h"
 
+#include <algorithm>
+#include <numeric>
+
 bool TrainRf::verbose = false;
 
 RcppExport SEXP TrainRF(const SEXP sDeframe, const SEXP sArgList) {
@@ -81,36 +84,48 @@ List TrainRf::train(const List& argList,
 }
 
 
-// Employs Rcpp-style temporaries for ease of indexing through
-// the predMap[] vector.
+vector<double> TrainRf::corePredOrder(const NumericVector& feVec,
+				      const vector<unsigned int>& predMap) {
+  vector<double> coreVec(predMap.size());
+  for (size_t i = 0; i < predMap.size(); i++) {
+    coreVec[i] = feVec[predMap[i]];
+  }
+  return coreVec;
+}
+
+
+// Gathers per-predictor arguments directly into core order, avoiding
+// intermediate subscripted R vectors.
 SEXP TrainRf::initFromArgs(const List& argList,
 			   TrainBridge* trainBridge) {
   BEGIN_RCPP
 
-  vector<PredictorT> pm = trainBridge->getPredMap();
-  // Temporary IntegerVector copy for subscripted access.
-  IntegerVector predMap(pm.begin(), pm.end());
+  vector<PredictorT> predMap = trainBridge->getPredMap();
 
   verbose = as<bool>(argList["verbose"]);
   SamplerR::init(as<bool>(argList["thinLeaves"]));
   
-  NumericVector probVecNV((SEXP) argList["probVec"]);
-  vector<double> predProb(as<vector<double> >(probVecNV[predMap]));
+  vector<double> predProb(corePredOrder(NumericVector((SEXP) argList["probVec"]), predMap));
   trainBridge->initProb(as<PredictorT>(argList["predFixed"]), predProb);
 
-  RowSample::init(as<NumericVector>(argList["rowWeight"]),
-                   as<bool>(argList["withRepl"]));
-  trainBridge->initSample(as<IndexT>(argList["nSamp"]));
+  // Scalars consulted more than once are unmarshalled once:  named
+  // List access searches the names linearly.
+  IndexT nSamp = as<IndexT>(argList["nSamp"]);
+  unsigned int minNode = as<unsigned int>(argList["minNode"]);
+
+  RowSample::init((SEXP) argList["rowWeight"],
+		  Rf_length((SEXP) argList["y"]),
+		  as<bool>(argList["withRepl"]));
+  trainBridge->initSample(nSamp);
 
-  NumericVector splitQuantNV((SEXP) argList["splitQuant"]);
-  vector<double> splitQuant(as<vector<double> >(splitQuantNV[predMap]));
-  trainBridge->initSplit(as<unsigned int>(argList["minNode"]),
+  vector<double> splitQuant(corePredOrder(NumericVector((SEXP) argList["splitQuant"]), predMap));
+  trainBridge->initSplit(minNode,
 			 as<unsigned int>(argList["nLevel"]),
 			 as<double>(argList["minInfo"]),
 			 splitQuant);
 
-  trainBridge->initTree(as<IndexT>(argList["nSamp"]),
-                  as<unsigned int>(argList["minNode"]),
+  trainBridge->initTree(nSamp,
+                  minNode,
                   as<unsigned int>(argList["maxLeaf"]));
   trainBridge->initBlock(as<unsigned int>(argList["treeBlock"]));
   trainBridge->initOmp(as<unsigned int>(argList["nThread"]));
@@ -118,8 +133,7 @@ SEXP TrainRf::initFromArgs(const List& argList,
   unsigned int nCtg = as<unsigned int>(argList["nCtg"]);
   trainBridge->initCtgWidth(nCtg);
   if (nCtg == 0) { // Regression only.
-    NumericVector regMonoNV((SEXP) argList["regMono"]);
-    vector<double> regMono(as<vector<double> >(regMonoNV[predMap]));
+    vector<double> regMono(corePredOrder(NumericVector((SEXP) argList["regMono"]), predMap));
     trainBridge->initMono(regMono);
   }
 
@@ -143,10 +157,10 @@ unique_ptr<TrainRf> TrainRf::classification(const List& argList,
   NumericVector classWeight((SEXP) argList["classWeight"]);
   unsigned int nTree = as<unsigned int>(argList["nTree"]);
 
-  IntegerVector yZero = yTrain - 1; // Zero-based translation.
-  vector<unsigned int> yzVec(yZero.begin(), yZero.end());
-  NumericVector weight = ctgWeight(yZero, classWeight);
-  vector<double> weightVec(weight.begin(), weight.end());
+  // Zero-based translation, written directly into core-style vector.
+  vector<unsigned int> yzVec(yTrain.length());
+  std::transform(yTrain.begin(), yTrain.end(), yzVec.begin(), [](int ctg) { return ctg - 1; });
+  vector<double> weightVec(ctgWeight(yzVec, classWeight));
   
   unique_ptr<TrainRf> tb = make_unique<TrainRf>(nTree, yTrain);
   for (unsigned int treeOff = 0; treeOff < nTree; treeOff += treeChunk) {
@@ -163,25 +177,30 @@ unique_ptr<TrainRf> TrainRf::classification(const List& argList,
 }
 
 
-NumericVector TrainRf::ctgWeight(const IntegerVector& y,
-				 const NumericVector& classWeight) {
-
-  BEGIN_RCPP
-    
-  auto scaledWeight = clone(classWeight);
+vector<double> TrainRf::ctgWeight(const vector<unsigned int>& y,
+				  const NumericVector& classWeight) {
+  vector<double> scaledWeight(classWeight.begin(), classWeight.end());
   // Default class weight is all unit:  scaling yields 1.0 / nCtg uniformly.
   // All zeroes is a place-holder to indicate balanced scaling:  class weights
   // are proportional to the inverse of the count of the class in the response.
-  if (is_true(all(classWeight == 0.0))) {
-    NumericVector tb(table(y));
-    for (R_len_t i = 0; i < classWeight.length(); i++) {
-      scaledWeight[i] = tb[i] == 0.0 ? 0.0 : 1.0 / tb[i];
+  if (std::all_of(scaledWeight.begin(), scaledWeight.end(), [](double weight) { return weight == 0.0; })) {
+    // Direct census indexed by category, rather than a hashed table().
+    vector<size_t> ctgCount(scaledWeight.size());
+    for (auto ctg : y) {
+      ctgCount[ctg]++;
+    }
+    for (size_t ctg = 0; ctg < scaledWeight.size(); ctg++) {
+      scaledWeight[ctg] = ctgCount[ctg] == 0 ? 0.0 : 1.0 / ctgCount[ctg];
     }
   }
-  NumericVector yWeighted = scaledWeight / sum(scaledWeight); // in [0,1]
-  return yWeighted[y];
 
-  END_RCPP
+  // Scales while gathering by response, without intermediate R vectors.
+  double recipSum = 1.0 / std::accumulate(scaledWeight.begin(), scaledWeight.end(), 0.0);
+  vector<double> yWeighted(y.size());
+  for (size_t row = 0; row < y.size(); row++) {
+    yWeighted[row] = scaledWeight[y[row]] * recipSum; // in [0,1]
+  }
+  return yWeighted;
 }
 
 
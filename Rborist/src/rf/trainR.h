@@ -108,8 +108,8 @@ struct TrainRf {
 
       @return vector of scaled class weights.
   */
-  static NumericVector ctgWeight(const IntegerVector &y,
-				 const NumericVector &classWeight);
+  static vector<double> ctgWeight(const vector<unsigned int>& y,
+				  const NumericVector& classWeight);
 
 
 
@@ -121,6 +121,19 @@ struct TrainRf {
   NumericVector scaleInfo(const TrainBridge* trainBridge);
 
   
+  /**
+     @brief Gathers a per-predictor front-end vector into core order.
+
+     @param feVec is a front-end vector indexed by predictor.
+
+     @param predMap maps core predictor indices to front-end indices.
+
+     @return vector of front-end values, in core order.
+   */
+  static vector<double> corePredOrder(const NumericVector& feVec,
+				      const vector<unsigned int>& predMap);
+
+
   /**
      @return implicit R_NilValue.
    */
@@ -43,4 +43,22 @@ private:
   static const unsigned int maxThreads;
 };
 
+
+/**
+   @brief Sets the thread count for the lifetime of a scope, restoring
+   the prior count on exit, exceptional or otherwise.
+ */
+struct OmpThreadScope {
+  const unsigned int nThreadPrev;
+
+  OmpThreadScope(unsigned int nThread_) :
+    nThreadPrev(OmpThread::nThread) {
+    OmpThread::init(nThread_);
+  }
+
+  ~OmpThreadScope() {
+    OmpThread::nThread = nThreadPrev;
+  }
+};
+
 #endif
@@ -248,7 +248,7 @@ public:
   /**
      @brief Getter for run lengths.
    */
-  const vector<size_t> getRunLength() const {
+  const vector<size_t>& getRunLength() const {
     return runLength;
   }
 
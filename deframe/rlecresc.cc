@@ -84,18 +84,3 @@ void RLECresc::encodeFrameFac(const uint32_t*  feVal) {
     }
   }
 }
-
-
-void RLECresc::dump(vector<size_t>& valOut,
-		    vector<size_t>& extentOut,
-		    vector<size_t>& rowOut) const {
-  size_t i = 0;
-  for (auto rlePred : rle) {
-    for (auto rlEnc : rlePred) {
-      valOut[i] = rlEnc.val;
-      extentOut[i] = rlEnc.extent;
-      rowOut[i] = rlEnc.row;
-      i++;
-    }
-  }
-}
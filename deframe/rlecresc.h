@@ -18,6 +18,7 @@
 
 #include "rle.h"
 #include "valrank.h"
+#include "ompthread.h"
 
 #include <cstdint>
 #include <vector>
@@ -220,9 +221,32 @@ class RLECresc {
   void encodeFrameFac(const uint32_t* feVal);
 
 
-  void dump(vector<size_t>& valOut,
-	    vector<size_t>& lengthOut,
-	    vector<size_t>& rowOut) const;
+  /**
+     @brief Dumps the run fields into caller-allocated buffers.
+
+     Output type is chosen by the caller, typically a 32-bit integer
+     sufficient to hold any row index.
+
+     @param[out] valOut outputs the run ranks.
+
+     @param[out] extentOut outputs the run lengths.
+
+     @param[out] rowOut outputs the run starting rows.
+   */
+  template<typename outType>
+  void dump(outType valOut[],
+	    outType extentOut[],
+	    outType rowOut[]) const {
+    size_t i = 0;
+    for (auto & rlePred : rle) {
+      for (auto & rlEnc : rlePred) {
+	valOut[i] = rlEnc.val;
+	extentOut[i] = rlEnc.extent;
+	rowOut[i] = rlEnc.row;
+	i++;
+      }
+    }
+  }
   
 
   /**
@@ -246,10 +270,24 @@ class RLECresc {
 				      const vector<size_t>&  feRowStart,
 				      const vector<size_t>&  feRunLength) {
     vector<vector<valType>> val(nPredType);
-    size_t colOff = 0;
-    unsigned int predIdx = 0;
-    for (auto & valPred : val) {
-      colOff += sortSparse(valPred, predIdx++, &feVal[colOff], &feRowStart[colOff], &feRunLength[colOff]);
+
+    // Column offsets are fixed by the run lengths, allowing the
+    // columns to be sorted independently.
+    vector<size_t> colOff(nPredType);
+    size_t runIdx = 0;
+    for (auto & off : colOff) {
+      off = runIdx;
+      for (size_t rowTot = 0; rowTot < nRow; rowTot += feRunLength[runIdx++]);
+    }
+
+    OMPBound nPred = nPredType;
+#pragma omp parallel default(shared) num_threads(OmpThread::nThread)
+    {
+#pragma omp for schedule(dynamic, 1)
+      for (OMPBound predIdx = 0; predIdx < nPred; predIdx++) {
+	size_t off = colOff[predIdx];
+	(void) sortSparse(val[predIdx], predIdx, &feVal[off], &feRowStart[off], &feRunLength[off]);
+      }
     }
     return val;
   }
@@ -14,26 +14,37 @@
  */
 
 #include "rleframe.h"
+#include "ompthread.h"
 
 
 RLEFrame::RLEFrame(size_t nRow_,
 		   const vector<PredictorForm>& predForm_,
-		   const vector<size_t>& runVal,
-		   const vector<size_t>& runLength,
-		   const vector<size_t>& runRow,
+		   const unsigned int runVal[],
+		   const unsigned int runLength[],
+		   const unsigned int runRow[],
 		   const vector<size_t>& rleHeight,
-		   const vector<double>& numVal,
+		   const double numVal[],
 		   const vector<size_t>& numHeight,
-		   const vector<unsigned int>& facVal,
+		   const unsigned int facVal[],
 		   const vector<size_t>& facHeight) :
   nRow(nRow_),
   predForm(predForm_),
   rlePred(vector<vector<RLEVal<unsigned int>>>(rleHeight.size())),
   numRanked(vector<vector<double>>(numHeight.size())),
-  facRanked(vector<vector<unsigned int>>(facHeight.size())) {
+  facRanked(vector<vector<unsigned int>>(facHeight.size())),
+  typedIdx(vector<unsigned int>(predForm.size())) {
+  unsigned int numIdx = 0;
+  unsigned int facIdx = 0;
+  for (unsigned int predIdx = 0; predIdx < predForm.size(); predIdx++) {
+    typedIdx[predIdx] = predForm[predIdx] == PredictorForm::numeric ? numIdx++ : facIdx++;
+  }
+
+  // Typed vectors are sized exactly from their heights, rather than
+  // grown, so that no slack capacity is retained.
   size_t off = 0;
   unsigned int predIdx = 0;
   for (auto height : rleHeight) {
+    rlePred[predIdx].reserve(height - off);
     for (; off < height; off++) {
       rlePred[predIdx].emplace_back(runVal[off], runRow[off], runLength[off]);
     }
@@ -41,17 +52,13 @@ RLEFrame::RLEFrame(size_t nRow_,
   }
   off = predIdx = 0;
   for (auto height : numHeight) {
-    for (; off < height; off++) {
-      numRanked[predIdx].emplace_back(numVal[off]);
-    }
-    predIdx++;
+    numRanked[predIdx++].assign(numVal + off, numVal + height);
+    off = height;
   }
   off = predIdx = 0;
   for (auto height : facHeight) {
-    for (; off < height; off++) {
-      facRanked[predIdx].emplace_back(facVal[off]);
-    }
-    predIdx++;
+    facRanked[predIdx++].assign(facVal + off, facVal + height);
+    off = height;
   }
 }
 
@@ -68,30 +75,88 @@ void RLEFrame::transpose(vector<size_t>& idxTr,
 			 size_t rowExtent,
 			 vector<unsigned int>& trFac,
 			 vector<double>& trNumeric) {
-  size_t rowOff = 0;
   size_t rowEnd = min(nRow, rowStart + rowExtent);
-  for (size_t row = rowStart; row != rowEnd; row++) {
-    unsigned int numIdx = 0;
-    unsigned int facIdx = 0;
-    for (unsigned int predIdx = 0; predIdx < idxTr.size(); predIdx++) {
-      unsigned int rank = idxRank(rlePred[predIdx], idxTr[predIdx], row);
-      if (predForm[predIdx] == PredictorForm::numeric) {
-	trNumeric[rowOff * getNPredNum() + numIdx] = numRanked[numIdx][rank];
-	numIdx++;
-      }
-      else {// TODO:  Replace subtraction with (front end)::fac2Rank()
-	trFac[rowOff * getNPredFac() + facIdx] = facRanked[facIdx][rank] - 1;
-	facIdx++;
+  if (rowEnd <= rowStart)
+    return;
+
+  // Cache-blocks the transposition by row tiles:  each tile's rows are
+  // written contiguously by a single task, with predictor reads confined
+  // to short, sequential spans.
+  OMPBound blockEnd = rowEnd;
+#pragma omp parallel default(shared) num_threads(OmpThread::nThread)
+  {
+#pragma omp for schedule(dynamic, 1)
+    for (OMPBound tileStart = rowStart; tileStart < blockEnd; tileStart += tileRows) {
+      size_t tileEnd = min(rowEnd, tileStart + tileRows);
+      for (unsigned int predIdx = 0; predIdx < idxTr.size(); predIdx++) {
+	size_t idxTile = seekRun(predIdx, idxTr[predIdx], tileStart);
+	if (predForm[predIdx] == PredictorForm::numeric) {
+	  transposeNum(predIdx, idxTile, rowStart, tileStart, tileEnd, trNumeric);
+	}
+	else {
+	  transposeFac(predIdx, idxTile, rowStart, tileStart, tileEnd, trFac);
+	}
       }
     }
-    rowOff++;
+  }
+
+  // Advances the cursors to the last row transposed.
+  for (unsigned int predIdx = 0; predIdx < idxTr.size(); predIdx++) {
+    idxTr[predIdx] = seekRun(predIdx, idxTr[predIdx], rowEnd - 1);
+  }
+}
+
+
+size_t RLEFrame::seekRun(unsigned int predIdx,
+			 size_t idxStart,
+			 size_t row) const {
+  const vector<RLEVal<unsigned int>>& rleVec = rlePred[predIdx];
+  auto runNext = upper_bound(rleVec.begin() + idxStart, rleVec.end(), row,
+			     [](size_t rowKey, const RLEVal<unsigned int>& rle) {
+			       return rowKey < rle.row;
+			     });
+  return (runNext - rleVec.begin()) - 1;
+}
+
+
+void RLEFrame::transposeNum(unsigned int predIdx,
+			    size_t idxTr,
+			    size_t rowBase,
+			    size_t rowStart,
+			    size_t rowEnd,
+			    vector<double>& trNumeric) const {
+  unsigned int numIdx = typedIdx[predIdx];
+  const vector<double>& numVal = numRanked[numIdx];
+  size_t stride = getNPredNum();
+  double* trOut = &trNumeric[(rowStart - rowBase) * stride + numIdx];
+  for (size_t row = rowStart; row != rowEnd; row++) {
+    *trOut = numVal[idxRank(rlePred[predIdx], idxTr, row)];
+    trOut += stride;
+  }
+}
+
+
+void RLEFrame::transposeFac(unsigned int predIdx,
+			    size_t idxTr,
+			    size_t rowBase,
+			    size_t rowStart,
+			    size_t rowEnd,
+			    vector<unsigned int>& trFac) const {
+  unsigned int facIdx = typedIdx[predIdx];
+  const vector<unsigned int>& facVal = facRanked[facIdx];
+  size_t stride = getNPredFac();
+  unsigned int* trOut = &trFac[(rowStart - rowBase) * stride + facIdx];
+  for (size_t row = rowStart; row != rowEnd; row++) {
+    // TODO:  Replace subtraction with (front end)::fac2Rank()
+    *trOut = facVal[idxRank(rlePred[predIdx], idxTr, row)] - 1;
+    trOut += stride;
   }
 }
 
 
 vector<RLEVal<unsigned int>> RLEFrame::permute(unsigned int predIdx,
 					       const vector<size_t>& idxPerm) const {
-  vector<size_t> row2Rank(nRow);
+  vector<unsigned int> row2Rank(nRow); // Every row covered by some run.
   for (auto rle : rlePred[predIdx]) {
     for (size_t row = rle.row; row != rle.row + rle.extent; row++) {
       row2Rank[row] = rle.val;
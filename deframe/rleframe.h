@@ -22,25 +22,31 @@
    @brief Completed form, constructed from front end representation.
  */
 struct RLEFrame {
+  static constexpr size_t tileRows = 0x100; // Row extent of transposition tile.
+
   const size_t nRow;
   const vector<PredictorForm> predForm;
   vector<vector<RLEVal<unsigned int>>> rlePred;
   vector<vector<double>> numRanked;
   vector<vector<unsigned int>> facRanked;
+  vector<unsigned int> typedIdx; // Position within typed block, by predictor.
 
   
   /**
      @brief Constructor from unpacked representation.
+
+     Run fields and ranked values are read in place from the front
+     end's buffers and packed directly into per-predictor vectors.
    */
   RLEFrame(size_t nRow_,
 	   const vector<PredictorForm>& predForm_,
-	   const vector<size_t>& runVal,
-	   const vector<size_t>& runLenght,
-	   const vector<size_t>& runRow,
+	   const unsigned int runVal[],
+	   const unsigned int runLength[],
+	   const unsigned int runRow[],
 	   const vector<size_t>& rleHeight_,
-	   const vector<double>& numVal_,
+	   const double numVal_[],
 	   const vector<size_t>& numHeight_,
-	   const vector<unsigned int>& facVal_,
+	   const unsigned int facVal_[],
 	   const vector<size_t>& facHeight_);
 
   
@@ -119,6 +125,58 @@ struct RLEFrame {
 
 private:
 
+  /**
+     @brief Locates the run containing a given row.
+
+     Runs are assumed to be ordered by row.
+
+     @param predIdx is the predictor index.
+
+     @param idxStart is a run index at or below the one sought.
+
+     @param row is the row to locate.
+
+     @return index of the run containing the row.
+   */
+  size_t seekRun(unsigned int predIdx,
+		 size_t idxStart,
+		 size_t row) const;
+
+
+  /**
+     @brief Transposes a single numeric predictor over a row range.
+
+     @param predIdx is the predictor index.
+
+     @param idxTr is the index of the run containing the starting row.
+
+     @param rowBase is the starting row of the transposed block.
+
+     @param rowStart is the starting source row.
+
+     @param rowEnd is the sup of source rows.
+
+     @param[out] trNumeric is the transposed block of numeric values.
+   */
+  void transposeNum(unsigned int predIdx,
+		    size_t idxTr,
+		    size_t rowBase,
+		    size_t rowStart,
+		    size_t rowEnd,
+		    vector<double>& trNumeric) const;
+
+
+  /**
+     @brief As above, but transposes a factor-valued predictor.
+   */
+  void transposeFac(unsigned int predIdx,
+		    size_t idxTr,
+		    size_t rowBase,
+		    size_t rowStart,
+		    size_t rowEnd,
+		    vector<unsigned int>& trFac) const;
+
+
   /**
      @brief Obtains the predictor rank at a given row.
 
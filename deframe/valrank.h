@@ -27,11 +27,11 @@ using namespace std;
 template<typename tn>
 struct ValRow {
   tn val;
-  size_t row;
+  unsigned int row; // 32 bits suffice, narrowing the sorted workspace.
   unsigned int rank; // For now.
 
   void init(tn val,
-	    size_t row) {
+	    unsigned int row) {
     this->val = val;
     this->row = row;
     rank = 0; // Assigned separately.
@@ -105,11 +105,7 @@ public:
      N.B.:  extraneous parentheses work around parser error in older g++.
    */
   void order() {
-    sort(valRow.begin(), valRow.end(), [] (const ValRow<tn>& a,
-                                           const ValRow<tn>& b) -> bool {
-                                         return (a.val < b.val) || ((a.val == b.val) && ((a.row) < b.row));
-                                       }
-      );
+    sortVal();
 
     // Increments rank values beginning from default value of zero at base.
     //
@@ -119,6 +115,47 @@ public:
   }
 
 
+  /**
+     @brief Orders by value, then by row.
+   */
+  static bool valRowLess(const ValRow<tn>& a,
+			 const ValRow<tn>& b) {
+    return (a.val < b.val) || ((a.val == b.val) && ((a.row) < b.row));
+  }
+
+
+  /**
+     @brief Sorts by value, then by row.
+   */
+  void sortVal() {
+    sort(valRow.begin(), valRow.end(), valRowLess);
+  }
+
+
+  /**
+     @brief Stable counting sort on value, for small integer codes.
+
+     Rows are entered in increasing order, so stability yields the
+     same ordering as valRowLess().
+
+     @param valMax is the maximal value.
+   */
+  void sortCount(tn valMax) {
+    vector<size_t> valStart(valMax + 2);
+    for (auto & vr : valRow) {
+      valStart[vr.val + 1]++;
+    }
+    for (size_t val = 1; val < valStart.size(); val++) {
+      valStart[val] += valStart[val - 1];
+    }
+    vector<ValRow<tn>> sorted(nRow);
+    for (auto & vr : valRow) {
+      sorted[valStart[vr.val]++] = vr;
+    }
+    valRow = move(sorted);
+  }
+
+
   /**
      @brief Presents ranks in row order.
 
@@ -126,11 +163,29 @@ public:
    */
   vector<unsigned int> rank() const {
     vector<unsigned int> row2Rank(nRow);
-    for (auto vr : valRow) {
+    for (const auto & vr : valRow) {
       row2Rank[vr.row] = vr.rank;
     }
     return row2Rank;
   }
 };
 
+/**
+   @brief Factor codes are dense integers, admitting a linear-time sort
+   whenever the code range does not exceed the row count.
+ */
+template<>
+inline void ValRank<unsigned int>::sortVal() {
+  unsigned int valMax = 0;
+  for (auto & vr : valRow) {
+    valMax = max(valMax, vr.val);
+  }
+  if (valMax <= nRow) {
+    sortCount(valMax);
+  }
+  else {
+    sort(valRow.begin(), valRow.end(), valRowLess);
+  }
+}
+
 #endif
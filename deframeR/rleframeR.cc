@@ -25,6 +25,8 @@
 
 #include "rleframeR.h"
 
+#include <algorithm>
+
 
 List RLEFrameR::presortDF(const DataFrame& df, SEXP sSigTrain, SEXP sLevel) {
   BEGIN_RCPP
@@ -48,7 +50,9 @@ List RLEFrameR::presortDF(const DataFrame& df, SEXP sSigTrain, SEXP sLevel) {
   for (unsigned int predIdx = 0; predIdx < df.length(); predIdx++) {
     if (Rf_isFactor(df[predIdx])) {
       rleCresc->setFactor(predIdx, true);
-      colBase[predIdx] = !Rf_isNull(sSigTrain) ? IntegerVector(factorRemap(_, nFac)).begin() : IntegerVector(df[predIdx]).begin();
+      // Remapped factors are addressed in place within the column-major
+      // matrix, rather than through a copied column.
+      colBase[predIdx] = !Rf_isNull(sSigTrain) ? factorRemap.begin() + nFac * factorRemap.nrow() : IntegerVector(df[predIdx]).begin();
       nFac++;
     }
     else {
@@ -57,6 +61,7 @@ List RLEFrameR::presortDF(const DataFrame& df, SEXP sSigTrain, SEXP sLevel) {
     }
   }
 
+  OmpThreadScope ompScope(0);
   rleCresc->encodeFrame(colBase);
 
   return wrap(rleCresc.get());
@@ -125,10 +130,9 @@ List RLEFrameR::presortIP(const BlockIPCresc<double>* rleCrescIP, size_t nRow, u
 
     auto rleCresc = make_unique<RLECresc>(nRow, nPred);
 
-  vector<double> valNum(rleCrescIP->getVal());
-  vector<size_t> rowStart(rleCrescIP->getRunStart());
-  vector<size_t> runLength(rleCrescIP->getRunLength());
-  rleCresc->encodeFrameNum(move(valNum), move(rowStart), move(runLength));
+  // Sparse encodings are presorted in place, without intermediate copies.
+  OmpThreadScope ompScope(0);
+  rleCresc->encodeFrameNum(rleCrescIP->getVal(), rleCrescIP->getRunStart(), rleCrescIP->getRunLength());
 
   return wrap(rleCresc.get());
 
@@ -141,6 +145,7 @@ List RLEFrameR::presortNum(const SEXP sX) {
 
   NumericMatrix x(sX);
   auto rleCresc = make_unique<RLECresc>(x.nrow(), x.ncol());
+  OmpThreadScope ompScope(0);
   rleCresc->encodeFrameNum(x.begin());
 
   return wrap(rleCresc.get());
@@ -154,6 +159,7 @@ List RLEFrameR::presortFac(const SEXP sX) {
 
   IntegerMatrix x(sX);
   auto rleCresc = make_unique<RLECresc>(x.nrow(), x.ncol());
+  OmpThreadScope ompScope(0);
   rleCresc->encodeFrameFac((uint32_t*)(x.begin()));
 
   return wrap(rleCresc.get());
@@ -180,13 +186,20 @@ List RLEFrameR::wrap(const RLECresc* rleCresc) {
 List RLEFrameR::wrapFac(const RLECresc* rleCresc) {
   BEGIN_RCPP
 
+  // Flattens the per-predictor values in a single, presized pass.
+  const vector<vector<unsigned int>>& valFac(rleCresc->getValFac());
   vector<size_t> facHeight;
-  vector<unsigned int> facValOut;
-  for (auto facPred : rleCresc->getValFac()) {
-    for (auto val : facPred) {
-      facValOut.push_back(val);
-    }
-    facHeight.push_back(facValOut.size());
+  size_t facTop = 0;
+  for (auto & facPred : valFac) {
+    facTop += facPred.size();
+    facHeight.push_back(facTop);
+  }
+  // Factor codes are emitted as 32-bit integers, rather than widened
+  // to double by the wrapper.
+  IntegerVector facValOut(facTop);
+  auto facOut = facValOut.begin();
+  for (auto & facPred : valFac) {
+    facOut = std::copy(facPred.begin(), facPred.end(), facOut);
   }
   
 
@@ -206,13 +219,18 @@ List RLEFrameR::wrapFac(const RLECresc* rleCresc) {
 List RLEFrameR::wrapNum(const RLECresc* rleCresc) {
   BEGIN_RCPP
 
+  // Flattens the per-predictor values in a single, presized pass.
+  const vector<vector<double>>& valNum(rleCresc->getValNum());
   vector<size_t> numHeight;
+  size_t numTop = 0;
+  for (auto & numPred : valNum) {
+    numTop += numPred.size();
+    numHeight.push_back(numTop);
+  }
   vector<double> numValOut;
-  for (auto numPred : rleCresc->getValNum()) {
-    for (auto val : numPred) {
-      numValOut.push_back(val);
-    }
-    numHeight.push_back(numValOut.size());
+  numValOut.reserve(numTop);
+  for (auto & numPred : valNum) {
+    numValOut.insert(numValOut.end(), numPred.begin(), numPred.end());
   }
   
 
@@ -234,10 +252,12 @@ List RLEFrameR::wrapRF(const RLECresc* rleCresc) {
 
   vector<size_t> rleHeight(rleCresc->getHeight());
   size_t height = rleHeight.back();
-  vector<size_t> valOut(height);
-  vector<size_t> lengthOut(height);
-  vector<size_t> rowOut(height);
-  rleCresc->dump(valOut, lengthOut, rowOut);
+  // Run fields are bounded by the row count, so are dumped directly
+  // into 32-bit vectors rather than widened to doubles by wrap().
+  IntegerVector valOut(height);
+  IntegerVector lengthOut(height);
+  IntegerVector rowOut(height);
+  rleCresc->dump(valOut.begin(), lengthOut.begin(), rowOut.begin());
   List rankedFrame = List::create(
 				  _["nRow"] = rleCresc->getNRow(),
 				  _["runVal"] = valOut,
@@ -259,7 +279,7 @@ unique_ptr<RLEFrame> RLEFrameR::unwrap(const List& lDeframe) {
   IntegerVector numHeight(Rf_isNull(blockNum["numHeight"]) ? IntegerVector(0) : IntegerVector((SEXP) blockNum["numHeight"]));
 
   List blockFac = checkFacRanked((SEXP) rleList["facRanked"]);
-  IntegerVector facVal(Rf_isNull(blockFac["facVal"]) ? NumericVector(0) : NumericVector((SEXP) blockFac["facVal"]));
+  IntegerVector facVal(Rf_isNull(blockFac["facVal"]) ? IntegerVector(0) : IntegerVector((SEXP) blockFac["facVal"]));
   IntegerVector facHeight(Rf_isNull(blockFac["facHeight"]) ? IntegerVector(0) : IntegerVector((SEXP) blockFac["facHeight"]));
 
   List rankedFrame((SEXP) rleList["rankedFrame"]);
@@ -277,12 +297,10 @@ unique_ptr<RLEFrame> RLEFrameR::unwrapFrame(const List& rankedFrame,
 					    const IntegerVector& numHeightFE,
 					    const IntegerVector& facValFE,
 					    const IntegerVector& facHeightFE) {
+  // Run fields are nonnegative, so are read in place as unsigned.
   IntegerVector valFE((SEXP) rankedFrame["runVal"]);
-  vector<size_t> runVal(valFE.begin(), valFE.end());
   IntegerVector lengthFE((SEXP) rankedFrame["runLength"]);
-  vector<size_t> runLength(lengthFE.begin(), lengthFE.end());
   IntegerVector rowFE((SEXP) rankedFrame["runRow"]);
-  vector<size_t> runRow(rowFE.begin(), rowFE.end());
   IntegerVector heightFE((SEXP) rankedFrame["rleHeight"]);
   vector<size_t> rleHeight(heightFE.begin(), heightFE.end());
   IntegerVector predFormFE((SEXP) rankedFrame["predForm"]);
@@ -291,21 +309,20 @@ unique_ptr<RLEFrame> RLEFrameR::unwrapFrame(const List& rankedFrame,
     predForm.push_back(static_cast<PredictorForm>(form));
   }
   
-  vector<double> numVal(numValFE.begin(), numValFE.end());
+  // Ranked values are likewise read in place; factor codes are nonnegative.
   vector<size_t> numHeight(numHeightFE.begin(), numHeightFE.end());
-  vector<unsigned int> facVal(facValFE.begin(), facValFE.end());
   vector<size_t> facHeight(facHeightFE.begin(), facHeightFE.end());
 
   size_t nRow(as<size_t>((SEXP) rankedFrame["nRow"]));
   return make_unique<RLEFrame>(nRow,
 			       move(predForm),
-			       move(runVal),
-			       move(runLength),
-			       move(runRow),
+			       (const unsigned int*) valFE.begin(),
+			       (const unsigned int*) lengthFE.begin(),
+			       (const unsigned int*) rowFE.begin(),
 			       move(rleHeight),
-			       move(numVal),
+			       numValFE.begin(),
 			       move(numHeight),
-			       move(facVal),
+			       (const unsigned int*) facValFE.begin(),
 			       move(facHeight));
 }
 
@@ -66,6 +66,7 @@ vector<vector<size_t>> Forest::leafNodes(size_t nNode,
 vector<vector<double>> Forest::getScores() const {
   vector<vector<double>> treeScore(leafNode.size());
   for (unsigned int tIdx = 0; tIdx < leafNode.size(); tIdx++) {
+    treeScore[tIdx].reserve(leafNode[tIdx].size());
     for (auto leafIdx : leafNode[tIdx]) {
       treeScore[tIdx].push_back(treeNode[leafIdx].getScore());
     }
@@ -51,7 +51,7 @@ Predict::Predict(const Forest* forest,
   nRow(rleFrame->getNRow()),
   nTree(forest->getNTree()),
   noLeaf(scoreHeight.back()),
-  walkTree(nPredFac == 0 ? &Predict::walkNum : (nPredNum == 0 ? &Predict::walkFac : &Predict::walkMixed)),
+  walkTree(selectWalker()),
   trFac(vector<unsigned int>(scoreChunk * nPredFac)),
   trNum(vector<double>(scoreChunk * nPredNum)),
   trIdx(vector<size_t>(nPredNum + nPredFac)) {
@@ -59,10 +59,20 @@ Predict::Predict(const Forest* forest,
 }
 
 
+void (Predict::* Predict::selectWalker() const)(size_t, size_t) {
+  if (nPredFac == 0)
+    return bagging ? &Predict::walkNum<true> : &Predict::walkNum<false>;
+  else if (nPredNum == 0)
+    return bagging ? &Predict::walkFac<true> : &Predict::walkFac<false>;
+  else
+    return bagging ? &Predict::walkMixed<true> : &Predict::walkMixed<false>;
+}
+
+
 vector<size_t> Predict::scoreHeights() const {
   vector<size_t> scoreHeight;
   size_t height = 0; // Accumulated height.
-  for (auto treeScores : scoreBlock) {
+  for (const auto & treeScores : scoreBlock) {
     height += treeScores.size();
     scoreHeight.push_back(height);
   }
@@ -202,7 +212,6 @@ size_t Predict::predictBlock(size_t rowStart,
   size_t row = rowStart;
   for (; row + blockRows <= rowEnd; row += blockRows) {
     rleFrame->transpose(trIdx, row, scoreChunk, trFac, trNum);
-    fill(predictLeaves.begin(), predictLeaves.end(), noLeaf);
     blockStart = row;
     blockEnd = row + blockRows;
     predictBlock();
@@ -219,7 +228,12 @@ void Predict::predictBlock() {
   {
 #pragma omp for schedule(dynamic, 1)
   for (OMPBound row = rowStart; row < rowEnd; row += seqChunk) {
-    scoreSeq(row, min(rowEnd, row + seqChunk));
+    OMPBound seqEnd = min(rowEnd, row + seqChunk);
+    // Each task resets the leaves of its own rows x trees tile.
+    fill(predictLeaves.begin() + nTree * (row - rowStart),
+	 predictLeaves.begin() + nTree * (seqEnd - rowStart),
+	 noLeaf);
+    scoreSeq(row, seqEnd);
   }
   }
 }
@@ -227,16 +241,16 @@ void Predict::predictBlock() {
 
 // Sequential inner loop to avoid false sharing.
 void PredictReg::scoreSeq(size_t rowStart, size_t rowEnd) {
+  (this->*Predict::walkTree)(rowStart, rowEnd);
   for (size_t row = rowStart; row != rowEnd; row++) {
-    (this->*Predict::walkTree)(row);
     testing ? testRow(row) : (void) scoreRow(row);
   }
 }
 
 
 void PredictCtg::scoreSeq(size_t rowStart, size_t rowEnd) {
+  (this->*Predict::walkTree)(rowStart, rowEnd);
   for (size_t row = rowStart; row != rowEnd; row++) {
-    (this->*Predict::walkTree)(row);
     testing ? testRow(row) : scoreRow(row);
   }
 }
@@ -310,32 +324,40 @@ const vector<double> PredictReg::getQEst() const {
 }
 
 
-void Predict::walkNum(size_t row) {
-  auto rowT = baseNum(row);
+template<bool isBagging>
+void Predict::walkNum(size_t rowStart,
+		      size_t rowEnd) {
   for (unsigned int tIdx = 0; tIdx < nTree; tIdx++) {
-    if (!bagging || !sampler->isBagged(tIdx, row)) {
-      rowNum(tIdx, rowT, row);
+    for (size_t row = rowStart; row != rowEnd; row++) {
+      if (!isBagging || !sampler->isBagged(tIdx, row)) {
+	rowNum(tIdx, baseNum(row), row);
+      }
     }
   }
 }
 
 
-void Predict::walkFac(size_t row) {
-  auto rowT = baseFac(row);
+template<bool isBagging>
+void Predict::walkFac(size_t rowStart,
+		      size_t rowEnd) {
   for (unsigned int tIdx = 0; tIdx < nTree; tIdx++) {
-    if (!bagging || !sampler->isBagged(tIdx, row)) {
-      rowFac(tIdx, rowT, row);
+    for (size_t row = rowStart; row != rowEnd; row++) {
+      if (!isBagging || !sampler->isBagged(tIdx, row)) {
+	rowFac(tIdx, baseFac(row), row);
+      }
     }
   }
 }
 
 
-void Predict::walkMixed(size_t row) {
-  const double* rowNT = baseNum(row);
-  const PredictorT* rowFT = baseFac(row);
+template<bool isBagging>
+void Predict::walkMixed(size_t rowStart,
+			size_t rowEnd) {
   for (unsigned int tIdx = 0; tIdx < nTree; tIdx++) {
-    if (!bagging || !sampler->isBagged(tIdx, row)) {
-      rowMixed(tIdx, rowNT, rowFT, row);
+    for (size_t row = rowStart; row != rowEnd; row++) {
+      if (!isBagging || !sampler->isBagged(tIdx, row)) {
+	rowMixed(tIdx, baseNum(row), baseFac(row), row);
+      }
     }
   }
 }
@@ -344,13 +366,7 @@ void Predict::walkMixed(size_t row) {
 void Predict::rowNum(unsigned int tIdx,
 		       const double* rowT,
 		       size_t row) {
-  IndexT leafIdx = noLeaf;
-  auto idx = treeOrigin[tIdx];
-  do {
-    idx += treeNode[idx].advance(rowT, leafIdx);
-  } while (leafIdx == noLeaf);
-
-  predictLeaf(row, tIdx, leafIdx);
+  predictLeaf(row, tIdx, treeNode[treeOrigin[tIdx]].descendNum(rowT));
 }
 
 
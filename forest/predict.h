@@ -104,23 +104,48 @@ protected:
   /**
      @brief Multi-row prediction with predictors of only numeric.
 
-     @param rowStart is the absolute starting row for the block.
+     Walkers are specialized on bagging, hoisting the in-bag test
+     out of the tree loop at compile time.
+
+     Trees form the outer loop, so that the upper nodes of a tree
+     remain cached while the rows of the sequential chunk descend.
+
+     @tparam isBagging is true iff in-bag rows are to be ignored.
+
+     @param rowStart is the absolute starting row of the chunk.
+
+     @param rowEnd is the absolute sup row of the chunk.
   */
-  void walkNum(size_t rowStart);
+  template<bool isBagging>
+  void walkNum(size_t rowStart,
+	       size_t rowEnd);
 
   /**
      @brief Multi-row prediction with predictors of only factor type.
 
      Parameters as above.
   */
-  void walkFac(size_t rowStart);
+  template<bool isBagging>
+  void walkFac(size_t rowStart,
+	       size_t rowEnd);
   
 
   /**
      @brief Prediction with predictors of both numeric and factor type.
      Parameters as above.
   */
-  void walkMixed(size_t rowStart);
+  template<bool isBagging>
+  void walkMixed(size_t rowStart,
+		 size_t rowEnd);
+
+
+  /**
+     @brief Selects the walker specialized for the frame's block
+     structure and bagging mode.
+
+     @return pointer to specialized walker.
+   */
+  void (Predict::* selectWalker() const)(size_t, size_t);
   
 
   /**
@@ -158,7 +183,7 @@ public:
      @brief Aliases a row-prediction method tailored for the frame's
      block structure.
    */
-  void (Predict::* walkTree)(size_t);
+  void (Predict::* walkTree)(size_t, size_t);
 
   vector<unsigned int> trFac; // OTF transposed factor observations.
   vector<double> trNum; // OTF transposed numeric observations.
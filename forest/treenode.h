@@ -123,6 +123,27 @@ public:
     return getLeafIdx(leafIdx) ? 0 : (delIdx + (rowT[getPredIdx()] <= getSplitNum() ? 0 : 1));
   }
 
+
+
+  /**
+     @brief Descends from this node to a terminal when observations
+     are all numerical.
+
+     Specializes the walk for the numeric case:  the leaf test and the
+     branch target are derived from a single field per level.
+
+     @param rowT is a row base within the transposed numerical set.
+
+     @return leaf index of the terminal reached.
+   */
+  inline IndexT descendNum(const double* rowT) const {
+    const TreeNode* node = this;
+    while (node->delIdx != 0) {
+      node += node->delIdx + (rowT[node->getPredIdx()] <= node->getSplitNum() ? 0 : 1);
+    }
+    return node->getPredIdx();
+  }
+
   
   /**
      @brief Node advancer, as above, but for all-categorical observations.
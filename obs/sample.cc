@@ -73,8 +73,7 @@ SampleReg::SampleReg(const TrainFrame *frame) : Sample(frame) {
 
 
 void SampleReg::bagSamples(const vector<double>& y) {
-  vector<PredictorT> ctgProxy(row2Sample.size());
-  Sample::bagSamples(y, ctgProxy);
+  Sample::bagSamples(y, vector<PredictorT>()); // No category:  empty proxy.
 }
 
 
@@ -107,16 +106,21 @@ void Sample::bagSamples(const vector<double>&  y,
   IndexT bagCount = countSamples(sCountRow);
 
   // Copies contents of sampled outcomes and builds mapping vectors.
+  // Every slot is written exactly once, so neither vector is
+  // pre-filled.
   //
-  fill(row2Sample.begin(), row2Sample.end(), bagCount);
-  delRow = vector<IndexT>(bagCount);
+  delRow.clear();
+  delRow.reserve(bagCount);
   IndexT sIdx = 0;
   IndexT rowPrev = 0;
   for (IndexT row = 0; row < nRow; row++) {
-    if (sCountRow[row] > 0) {
+    if (sCountRow[row] == 0) {
+      row2Sample[row] = bagCount; // Out-of-bag.
+    }
+    else {
       row2Sample[row] = sIdx;
-      delRow[sIdx] = row - rowPrev;
-      bagSum += addNode(delRow[sIdx], y[row], sCountRow[row], yCtg[row]);
+      delRow.push_back(row - rowPrev);
+      bagSum += addNode(delRow.back(), y[row], sCountRow[row], yCtg.empty() ? 0 : yCtg[row]);
       rowPrev = row;
       sIdx++;
     }
@@ -131,7 +135,7 @@ void Sample::bagTrivial(const vector<double>& y,
   fill(delRow.begin() + 1, delRow.end(), 1); // Saturates bag row.
   iota(row2Sample.begin(), row2Sample.end(), 0);
   for (IndexT row = 0; row < bagCount; row++) {
-    bagSum += addNode(delRow[row], y[row], 1, yCtg[row]);
+    bagSum += addNode(delRow[row], y[row], 1, yCtg.empty() ? 0 : yCtg[row]);
   }
 }
 
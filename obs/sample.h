@@ -80,7 +80,7 @@ class Sample {
 
      @param y is the proxy / response:  classification / summary.
 
-     @param yCtg is true response / zero:  classification / regression.
+     @param yCtg is true response / empty:  classification / regression.
   */
   void bagSamples(const vector<double>& y,
 		  const vector<PredictorT>& yCtg);
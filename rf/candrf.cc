@@ -27,9 +27,7 @@ vector<double> CandRF::predProb;
 void CandRF::init(PredictorT feFixed,
 	     const vector<double>& feProb) {
   predFixed = feFixed;
-  for (auto prob : feProb) {
-    predProb.push_back(prob);
-  }
+  predProb = feProb;
 }
 
 
@@ -365,9 +365,16 @@ void RunAccum::ctgGini(const vector<double>& sumSlice) {
   PredictorT trueSlots = 0; // Slot offsets of codes taking true branch.
   PredictorT lowSet = (1ul << (effCount() - 1)) - 1; // High bit unset, remainder set.
 
+  // Categories absent from the node contribute nothing to either side.
+  vector<PredictorT> ctgPresent;
+  for (PredictorT ctg = 0; ctg < sumSlice.size(); ctg++) {
+    if (sumSlice[ctg] != 0.0)
+      ctgPresent.push_back(ctg);
+  }
+
   // All nontrivial subsets, up to complement:
   for (unsigned int subset = 1; subset <= lowSet; subset++) {
-    if (trialSplit(subsetGini(sumSlice, subset))) {
+    if (trialSplit(subsetGini(sumSlice, ctgPresent, subset))) {
       trueSlots = subset;
     }
   }
@@ -382,6 +389,7 @@ void RunAccum::ctgGini(const vector<double>& sumSlice) {
 
 
 double RunAccum::subsetGini(const vector<double>& sumSlice,
+			    const vector<PredictorT>& ctgPresent,
 			    unsigned int subset) const {
   // getCellSum(..., ctg) decomposes 'sumCand' by category x run.
   // getSum(runIdx) decomposes 'sumCand' by run, so may be used
@@ -390,7 +398,7 @@ double RunAccum::subsetGini(const vector<double>& sumSlice,
   vector<double> sumSampled(nCtg);
   for (PredictorT runIdx = 0; runIdx < effCount() - 1; runIdx++) {
     if (subset & (1ul << runIdx)) {
-      for (PredictorT ctg = 0; ctg < nCtg; ctg++) {
+      for (PredictorT ctg : ctgPresent) {
 	sumSampled[ctg] += getCellSum(runIdx, nCtg, ctg);
       }
     }
@@ -399,12 +407,11 @@ double RunAccum::subsetGini(const vector<double>& sumSlice,
   double ssL = 0.0;
   double sumL = 0.0;
   double ssR = 0.0;
-  PredictorT ctg = 0;
-  for (auto maskedSum : sumSampled) {
+  for (PredictorT ctg : ctgPresent) {
+    double maskedSum = sumSampled[ctg];
     sumL += maskedSum;
     ssL += maskedSum * maskedSum;
     ssR += (sumSlice[ctg] - maskedSum) * (sumSlice[ctg] - maskedSum);
-    ctg++;
   }
 
   return infoGini(ssL, ssR, sumL, sumCand - sumL);
@@ -446,6 +446,8 @@ public:
 
      @param sumSlice decomposes the partition node response by category.
 
+     @param ctgPresent enumerates the categories having nonzero sum.
+
      @param subset bit-encodes a collection of runs.
 
      N.B.:  Gini value should be symmetric w.r.t. fixed-size complements.
@@ -456,6 +458,7 @@ public:
      @return Gini coefficient of subset.
    */
   double subsetGini(const vector<double>& sumSlice,
+		    const vector<PredictorT>& ctgPresent,
 		    unsigned int subset) const;
 
 
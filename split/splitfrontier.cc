@@ -373,8 +373,7 @@ void SFReg::immutables(const TrainFrame* frame,
   auto numExtent = frame->getNPredNum();
   auto monoCount = count_if(bridgeMono.begin() + numFirst, bridgeMono.begin() + numExtent, [] (double prob) { return prob != 0.0; });
   if (monoCount > 0) {
-    mono = vector<double>(frame->getNPredNum());
-    mono.assign(bridgeMono.begin() + frame->getNumFirst(), bridgeMono.begin() + frame->getNumFirst() + frame->getNPredNum());
+    mono.assign(bridgeMono.begin() + numFirst, bridgeMono.begin() + numFirst + numExtent);
   }
 }
 